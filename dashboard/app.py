@@ -7,6 +7,9 @@ trends, forecasts, and projections.
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
+import numpy as np
+import io
 import sys
 import os
 
@@ -21,6 +24,7 @@ from dashboard.utils import (
     create_comparison_chart,
     create_event_timeline,
     format_metric,
+    format_metric_series,
     calculate_progress_to_target
 )
 
@@ -58,11 +62,81 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Load data
-@st.cache_data
+# Load data. No cache_data wrapper here: load_all_data is
+# cache_resource-backed, and a cache_data layer would hand out a fresh
+# copy per rerun, changing the frame ids the caches below key on.
 def get_data():
     return load_all_data()
 
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def get_code_to_name(obs: pd.DataFrame) -> dict:
+    """Build a one-time indicator_code -> indicator name lookup."""
+    return obs.drop_duplicates('indicator_code').set_index('indicator_code')['indicator'].to_dict()
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def group_obs_by_code(obs: pd.DataFrame) -> dict:
+    """Pre-split observations into per-indicator frames.
+
+    load_all_data sorts by (indicator_code, observation_date), so each
+    group is already in date order.
+    """
+    return {
+        code: g.reset_index(drop=True)
+        for code, g in obs.groupby('indicator_code', sort=False, observed=True)
+    }
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def group_forecasts(f: pd.DataFrame) -> dict:
+    """Pre-split forecasts by (indicator_code, scenario), already date-sorted."""
+    if f.empty:
+        return {}
+    return {
+        key: g.reset_index(drop=True)
+        for key, g in f.groupby(['indicator_code', 'scenario'], sort=False, observed=True)
+    }
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def get_sorted_dates(obs: pd.DataFrame) -> np.ndarray:
+    """Pure date-sorted observation_date array for binary-search filters.
+
+    Needed because the loader sorts by (indicator_code, observation_date),
+    not by date alone.
+    """
+    return np.sort(obs['observation_date'].values)
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def forecast_value_by_year(f: pd.DataFrame) -> dict:
+    """(indicator_code, scenario, year) -> forecast value lookup table."""
+    if f.empty:
+        return {}
+    keyed = f if 'year' in f.columns else f.assign(year=f['observation_date'].dt.year)
+    keyed = keyed.groupby(['indicator_code', 'scenario', 'year'], observed=True, sort=False).first()
+    return keyed['value_numeric'].to_dict()
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def build_target_map(targets_df: pd.DataFrame) -> dict:
+    """Map lowercase indicator-code tokens to their target details."""
+    m = {}
+    for row in targets_df.itertuples(index=False):
+        for tok in str(row.indicator_code).lower().split('_'):
+            m.setdefault(tok, {'indicator': row.indicator, 'value_numeric': row.value_numeric})
+    return m
+
+
+@st.cache_data
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame to CSV once; reruns reuse the cached bytes."""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+
 data = get_data()
 
 if data is None:
@@ -75,6 +149,48 @@ targets = data['targets']
 impacts = data['impacts']
 forecasts = data.get('forecasts', pd.DataFrame())
 
+code_to_name = get_code_to_name(observations)
+obs_by_code = group_obs_by_code(observations)
+forecasts_by_code_scen = group_forecasts(forecasts)
+forecast_year_values = forecast_value_by_year(forecasts)
+target_map = build_target_map(targets)
+
+
+# Cached chart factories: keyed on primitive args only, the underlying
+# frames come from the module-level cache above. Each caches the figure
+# as its Plotly dict; rebuilding go.Figure from a dict skips trace
+# construction and validation entirely.
+@st.cache_data(max_entries=64)
+def cached_trend_chart(code: str, show_events: bool) -> dict:
+    return create_trend_chart(
+        obs_by_code[code],
+        code,
+        f"{code_to_name.get(code, code)} - Historical Trend",
+        show_events=show_events,
+        events_df=events if show_events else None
+    ).to_dict()
+
+
+@st.cache_data(max_entries=64)
+def cached_forecast_chart(code: str) -> dict:
+    return create_forecast_chart(
+        observations,
+        forecasts,
+        code,
+        f"{code_to_name.get(code, code)} - Forecast Scenarios"
+    ).to_dict()
+
+
+@st.cache_data(max_entries=64)
+def cached_comparison_chart(codes: tuple) -> dict:
+    return create_comparison_chart(observations, list(codes)).to_dict()
+
+
+@st.cache_data
+def cached_event_timeline() -> dict:
+    return create_event_timeline(events).to_dict()
+
+
 # Sidebar navigation
 st.sidebar.title("📊 Navigation")
 page = st.sidebar.radio(
@@ -98,7 +214,8 @@ st.sidebar.info(
 )
 
 # ==================== PAGE 1: OVERVIEW ====================
-if page == "🏠 Overview":
+@st.fragment
+def render_overview():
     st.markdown('<p class="main-header">🇪🇹 Ethiopia Financial Inclusion Dashboard</p>', unsafe_allow_html=True)
     
     st.markdown("### 📊 Key Metrics Summary")
@@ -173,7 +290,7 @@ if page == "🏠 Overview":
     st.markdown("### 📅 Key Events Timeline")
     
     if not events.empty:
-        timeline_fig = create_event_timeline(events)
+        timeline_fig = go.Figure(cached_event_timeline())
         st.plotly_chart(timeline_fig, width='stretch')
     
     st.markdown("---")
@@ -194,8 +311,8 @@ if page == "🏠 Overview":
     
     with col2:
         st.markdown("**🎯 2027 Targets**")
-        for _, target in targets.iterrows():
-            st.markdown(f"- {target['indicator']}: {target['value_numeric']}%")
+        target_lines = "- " + targets['indicator'].astype(str) + ": " + targets['value_numeric'].astype(str) + "%"
+        st.markdown("\n".join(target_lines.tolist()))
     
     # Data download
     st.markdown("---")
@@ -204,7 +321,7 @@ if page == "🏠 Overview":
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        csv = observations.to_csv(index=False)
+        csv = df_to_csv_bytes(observations)
         st.download_button(
             label="Download Observations",
             data=csv,
@@ -213,7 +330,7 @@ if page == "🏠 Overview":
         )
     
     with col2:
-        csv = events.to_csv(index=False)
+        csv = df_to_csv_bytes(events)
         st.download_button(
             label="Download Events",
             data=csv,
@@ -223,7 +340,7 @@ if page == "🏠 Overview":
     
     with col3:
         if not forecasts.empty:
-            csv = forecasts.to_csv(index=False)
+            csv = df_to_csv_bytes(forecasts)
             st.download_button(
                 label="Download Forecasts",
                 data=csv,
@@ -232,7 +349,8 @@ if page == "🏠 Overview":
             )
 
 # ==================== PAGE 2: TRENDS ANALYSIS ====================
-elif page == "📈 Trends Analysis":
+@st.fragment
+def render_trends():
     st.markdown('<p class="main-header">📈 Trends Analysis</p>', unsafe_allow_html=True)
     
     st.markdown("### Historical Financial Inclusion Trends")
@@ -246,28 +364,20 @@ elif page == "📈 Trends Analysis":
         selected_indicator = st.selectbox(
             "Select Indicator",
             available_indicators,
-            format_func=lambda x: observations[observations['indicator_code'] == x].iloc[0]['indicator']
+            format_func=lambda x: code_to_name.get(x, x)
         )
     
     with col2:
         show_events = st.checkbox("Show Events", value=True)
     
     # Create trend chart
-    indicator_name = observations[observations['indicator_code'] == selected_indicator].iloc[0]['indicator']
-    
-    trend_fig = create_trend_chart(
-        observations,
-        selected_indicator,
-        f"{indicator_name} - Historical Trend",
-        show_events=show_events,
-        events_df=events if show_events else None
-    )
-    
+    trend_fig = go.Figure(cached_trend_chart(selected_indicator, show_events))
+
     st.plotly_chart(trend_fig, width='stretch')
     
     # Show data table
     with st.expander("📋 View Data Table"):
-        indicator_data = observations[observations['indicator_code'] == selected_indicator][
+        indicator_data = obs_by_code[selected_indicator][
             ['observation_date', 'value_numeric', 'source_name', 'confidence']
         ].sort_values('observation_date', ascending=False)
         
@@ -284,11 +394,11 @@ elif page == "📈 Trends Analysis":
         default=['ACC_OWNERSHIP', 'ACC_MM_ACCOUNT', 'USG_DIGITAL_PAYMENT'] if all(
             x in available_indicators for x in ['ACC_OWNERSHIP', 'ACC_MM_ACCOUNT', 'USG_DIGITAL_PAYMENT']
         ) else available_indicators[:3],
-        format_func=lambda x: observations[observations['indicator_code'] == x].iloc[0]['indicator']
+        format_func=lambda x: code_to_name.get(x, x)
     )
     
     if comparison_indicators:
-        comparison_fig = create_comparison_chart(observations, comparison_indicators)
+        comparison_fig = go.Figure(cached_comparison_chart(tuple(sorted(comparison_indicators))))
         st.plotly_chart(comparison_fig, width='stretch')
     
     st.markdown("---")
@@ -307,16 +417,17 @@ elif page == "📈 Trends Analysis":
     with col2:
         end_date = st.date_input("End Date", max_date, min_value=min_date, max_value=max_date)
     
-    # Filter data by date range
-    filtered_obs = observations[
-        (observations['observation_date'] >= pd.to_datetime(start_date)) &
-        (observations['observation_date'] <= pd.to_datetime(end_date))
-    ]
-    
-    st.info(f"Showing {len(filtered_obs)} observations from {start_date} to {end_date}")
+    # Filter data by date range: two binary searches on the pre-sorted
+    # dates instead of building and combining two boolean masks
+    sorted_dates = get_sorted_dates(observations)
+    lo = np.searchsorted(sorted_dates, np.datetime64(start_date), side='left')
+    hi = np.searchsorted(sorted_dates, np.datetime64(end_date), side='right')
+
+    st.info(f"Showing {hi - lo} observations from {start_date} to {end_date}")
 
 # ==================== PAGE 3: FORECASTS ====================
-elif page == "🔮 Forecasts":
+@st.fragment
+def render_forecasts():
     st.markdown('<p class="main-header">🔮 Forecasts (2025-2027)</p>', unsafe_allow_html=True)
     
     if forecasts.empty:
@@ -330,76 +441,68 @@ elif page == "🔮 Forecasts":
         selected_forecast_indicator = st.selectbox(
             "Select Indicator for Forecast",
             forecast_indicators,
-            format_func=lambda x: observations[observations['indicator_code'] == x].iloc[0]['indicator'] if not observations[observations['indicator_code'] == x].empty else x
+            format_func=lambda x: code_to_name.get(x, x)
         )
-        
+
         # Create forecast chart
-        indicator_name = observations[observations['indicator_code'] == selected_forecast_indicator].iloc[0]['indicator'] if not observations[observations['indicator_code'] == selected_forecast_indicator].empty else selected_forecast_indicator
-        
-        forecast_fig = create_forecast_chart(
-            observations,
-            forecasts,
-            selected_forecast_indicator,
-            f"{indicator_name} - Forecast Scenarios"
-        )
-        
+        forecast_fig = go.Figure(cached_forecast_chart(selected_forecast_indicator))
+
         st.plotly_chart(forecast_fig, width='stretch')
         
         # Scenario comparison table
         st.markdown("### 📊 Scenario Comparison (2027)")
         
-        forecast_2027 = forecasts[
-            (forecasts['indicator_code'] == selected_forecast_indicator) &
-            (forecasts['observation_date'].dt.year == 2027)
-        ]
-        
-        if not forecast_2027.empty:
-            col1, col2, col3 = st.columns(3)
-            
-            for col, scenario, color in zip(
-                [col1, col2, col3],
-                ['pessimistic', 'base', 'optimistic'],
-                ['🔴', '🔵', '🟢']
-            ):
-                scenario_data = forecast_2027[forecast_2027['scenario'] == scenario]
-                if not scenario_data.empty:
-                    value = scenario_data.iloc[0]['value_numeric']
-                    with col:
-                        st.metric(
-                            label=f"{color} {scenario.capitalize()}",
-                            value=format_metric(value)
-                        )
+        col1, col2, col3 = st.columns(3)
+
+        for col, scenario, color in zip(
+            [col1, col2, col3],
+            ['pessimistic', 'base', 'optimistic'],
+            ['🔴', '🔵', '🟢']
+        ):
+            value = forecast_year_values.get((selected_forecast_indicator, scenario, 2027))
+            if value is not None:
+                with col:
+                    st.metric(
+                        label=f"{color} {scenario.capitalize()}",
+                        value=format_metric(value)
+                    )
         
         # Key projected milestones
         st.markdown("---")
         st.markdown("### 🎯 Key Projected Milestones")
         
-        base_forecasts = forecasts[forecasts['scenario'] == 'base']
-        
-        for indicator_code in forecast_indicators:
-            indicator_forecast = base_forecasts[base_forecasts['indicator_code'] == indicator_code]
-            
-            if not indicator_forecast.empty:
-                indicator_name = observations[observations['indicator_code'] == indicator_code].iloc[0]['indicator'] if not observations[observations['indicator_code'] == indicator_code].empty else indicator_code
-                
-                final_value = indicator_forecast.sort_values('observation_date').iloc[-1]['value_numeric']
-                
-                st.markdown(f"**{indicator_name}**")
-                st.markdown(f"- Projected 2027 value: {format_metric(final_value)}")
-                
-                # Check against target
-                target_row = targets[targets['indicator_code'].str.contains(indicator_code.split('_')[1], case=False, na=False)]
-                if not target_row.empty:
-                    target_value = target_row.iloc[0]['value_numeric']
-                    gap = final_value - target_value
-                    
-                    if gap >= 0:
-                        st.success(f"✅ Exceeds 2027 target by {format_metric(abs(gap), 'change')}")
-                    else:
-                        st.warning(f"⚠️ Falls short of 2027 target by {format_metric(abs(gap), 'change')}")
+        # Format every milestone value in one vectorized pass rather than
+        # one format_metric call per indicator per rerun
+        milestone_codes = [
+            code for code in forecast_indicators
+            if (code, 'base') in forecasts_by_code_scen
+        ]
+        final_values = np.array([
+            forecasts_by_code_scen[(code, 'base')].iloc[-1]['value_numeric']
+            for code in milestone_codes
+        ])
+        final_labels = format_metric_series(final_values)
+
+        for indicator_code, final_value, final_label in zip(milestone_codes, final_values, final_labels):
+            indicator_name = code_to_name.get(indicator_code, indicator_code)
+
+            st.markdown(f"**{indicator_name}**")
+            st.markdown(f"- Projected 2027 value: {final_label}")
+
+            # Check against target
+            target_info = target_map.get(indicator_code.split('_')[1].lower())
+            if target_info is not None:
+                target_value = target_info['value_numeric']
+                gap = final_value - target_value
+
+                if gap >= 0:
+                    st.success(f"✅ Exceeds 2027 target by {format_metric(abs(gap), 'change')}")
+                else:
+                    st.warning(f"⚠️ Falls short of 2027 target by {format_metric(abs(gap), 'change')}")
 
 # ==================== PAGE 4: INCLUSION PROJECTIONS ====================
-elif page == "🎯 Inclusion Projections":
+@st.fragment
+def render_projections():
     st.markdown('<p class="main-header">🎯 Financial Inclusion Projections</p>', unsafe_allow_html=True)
     
     st.markdown("### Progress Toward National Targets")
@@ -417,23 +520,25 @@ elif page == "🎯 Inclusion Projections":
         )
         
         scenario_forecasts = forecasts[forecasts['scenario'] == scenario_choice]
-        
+
+        # One-time token -> forecast code map, replacing the per-target
+        # substring scan over all forecast codes
+        forecast_code_by_token = {}
+        for code in scenario_forecasts['indicator_code'].unique():
+            for tok in str(code).lower().split('_'):
+                forecast_code_by_token.setdefault(tok, code)
+
         # Progress bars for each target
         for _, target in targets.iterrows():
             indicator_code_part = target['indicator_code'].split('_')[-1]
-            
+
             # Find matching forecast
-            matching_forecast = None
-            for code in scenario_forecasts['indicator_code'].unique():
-                if indicator_code_part.lower() in code.lower():
-                    matching_forecast = scenario_forecasts[
-                        (scenario_forecasts['indicator_code'] == code) &
-                        (scenario_forecasts['observation_date'].dt.year == 2027)
-                    ]
-                    break
-            
-            if matching_forecast is not None and not matching_forecast.empty:
-                current_value = matching_forecast.iloc[0]['value_numeric']
+            current_value = None
+            code = forecast_code_by_token.get(indicator_code_part.lower())
+            if code is not None:
+                current_value = forecast_year_values.get((code, scenario_choice, 2027))
+
+            if current_value is not None:
                 target_value = target['value_numeric']
                 
                 progress, status = calculate_progress_to_target(current_value, target_value)
@@ -502,19 +607,28 @@ elif page == "🎯 Inclusion Projections":
             """)
             
             for indicator_code in ['ACC_OWNERSHIP', 'USG_DIGITAL_PAYMENT']:
-                indicator_forecast = scenario_forecasts[scenario_forecasts['indicator_code'] == indicator_code]
+                indicator_forecast = forecasts_by_code_scen.get((indicator_code, scenario_choice), pd.DataFrame())
                 
                 if not indicator_forecast.empty:
-                    indicator_name = observations[observations['indicator_code'] == indicator_code].iloc[0]['indicator']
+                    indicator_name = code_to_name.get(indicator_code, indicator_code)
                     
                     st.markdown(f"\n**{indicator_name}:**")
                     
                     for year in [2025, 2026, 2027]:
-                        year_forecast = indicator_forecast[indicator_forecast['observation_date'].dt.year == year]
-                        if not year_forecast.empty:
-                            value = year_forecast.iloc[0]['value_numeric']
+                        value = forecast_year_values.get((indicator_code, scenario_choice, year))
+                        if value is not None:
                             st.markdown(f"- {year}: {format_metric(value)}")
 
+# Dispatch the selected page; fragments keep widget interactions inside
+# a page from re-running the whole script
+PAGES = {
+    "🏠 Overview": render_overview,
+    "📈 Trends Analysis": render_trends,
+    "🔮 Forecasts": render_forecasts,
+    "🎯 Inclusion Projections": render_projections,
+}
+PAGES[page]()
+
 # Footer
 st.markdown("---")
 st.markdown(
@@ -15,71 +15,212 @@ from typing import Dict, List, Tuple
 import os
 
 
+def _scatter_cls(n_points: int):
+    """Pick WebGL-backed Scattergl for large traces, SVG Scatter otherwise."""
+    return go.Scattergl if n_points > 1000 else go.Scatter
+
+
+_MAX_CHART_POINTS = 1500
+
+
+def _lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int = _MAX_CHART_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling for long series.
+
+    Caps the points shipped to the browser while keeping the visual
+    shape of the line. Series that already fit are returned unchanged.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    xf = x.astype('int64', copy=False).astype(np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    sampled = [0]
+
+    for i in range(n_out - 2):
+        avg_start = int(np.floor((i + 1) * every) + 1)
+        avg_end = min(int(np.floor((i + 2) * every) + 1), n)
+        avg_x = xf[avg_start:avg_end].mean()
+        avg_y = yf[avg_start:avg_end].mean()
+
+        range_start = int(np.floor(i * every) + 1)
+        range_end = int(np.floor((i + 1) * every) + 1)
+
+        ax_, ay_ = xf[a], yf[a]
+        areas = np.abs(
+            (ax_ - avg_x) * (yf[range_start:range_end] - ay_)
+            - (ax_ - xf[range_start:range_end]) * (avg_y - ay_)
+        )
+        a = range_start + int(np.argmax(areas))
+        sampled.append(a)
+
+    sampled.append(n - 1)
+    idx = np.asarray(sampled)
+    return x[idx], y[idx]
+
+
 @st.cache_data
-def load_all_data():
-    """Load all data files with caching."""
+def _load_forecasts(path: str, mtime: float) -> pd.DataFrame:
+    """Read the forecast CSV in one pass; mtime keys the cache so it
+    invalidates when the file is regenerated."""
+    return pd.read_csv(path, parse_dates=['observation_date'])
+
+
+_PARQUET_CACHE_DIR = 'data/cache'
+_PARQUET_CACHE_KEYS = ('observations', 'events', 'targets', 'impacts', 'raw_data')
+
+
+def _load_workbook(data_path: str) -> Dict[str, pd.DataFrame]:
+    """Load the unified workbook through a Parquet mirror.
+
+    Excel parsing dominates the cold-cache load; the columnar mirror
+    reads an order of magnitude faster and is rebuilt whenever the
+    workbook is newer than the cache (or the cache is incomplete).
+    """
     from src.loader import load_data
-    
+
+    paths = {k: os.path.join(_PARQUET_CACHE_DIR, f'{k}.parquet')
+             for k in _PARQUET_CACHE_KEYS}
+
+    try:
+        src_mtime = os.path.getmtime(data_path)
+        if all(os.path.exists(p) and os.path.getmtime(p) >= src_mtime
+               for p in paths.values()):
+            return {k: pd.read_parquet(p) for k, p in paths.items()}
+    except Exception:
+        pass  # unreadable cache: fall through to the Excel parse
+
+    data = load_data(data_path)
+
+    try:
+        os.makedirs(_PARQUET_CACHE_DIR, exist_ok=True)
+        for k, p in paths.items():
+            data[k].to_parquet(p, index=False)
+    except Exception:
+        pass  # missing pyarrow or read-only disk: just skip the mirror
+
+    return data
+
+
+@st.cache_resource
+def load_all_data():
+    """Load all data files with caching.
+
+    cache_resource (not cache_data) on purpose: every rerun receives the
+    same dict and frame objects, so the id-keyed derived caches below and
+    in app.py actually hit instead of re-pickling per rerun. Callers must
+    treat the returned frames as read-only.
+    """
     data_path = 'data/raw/ethiopia_fi_unified_data.xlsx'
-    
+
     if not os.path.exists(data_path):
         st.error(f"Data file not found: {data_path}")
         return None
-    
-    data = load_data(data_path)
-    
-    # Load forecasts if available
+
+    data = _load_workbook(data_path)
+
+    # Load forecasts if available, preferring the Parquet twin written by
+    # the forecast pipeline (faster read, datetime dtype preserved)
     forecast_path = 'data/processed/task4_forecasts_2025_2027.csv'
-    if os.path.exists(forecast_path):
-        data['forecasts'] = pd.read_csv(forecast_path)
-        data['forecasts']['observation_date'] = pd.to_datetime(data['forecasts']['observation_date'])
+    forecast_path_pq = forecast_path.replace('.csv', '.parquet')
+    if os.path.exists(forecast_path_pq):
+        data['forecasts'] = pd.read_parquet(forecast_path_pq)
+    elif os.path.exists(forecast_path):
+        data['forecasts'] = _load_forecasts(forecast_path, os.path.getmtime(forecast_path))
     else:
         data['forecasts'] = pd.DataFrame()
-    
+
+    # The loader memoizes and shares its frames across callers; copy the
+    # ones rewritten in place below so other load_data users in this
+    # process keep the pristine versions
+    for key in ('observations', 'events', 'targets', 'forecasts'):
+        data[key] = data[key].copy()
+
+    # Coerce dates exactly once; every chart and slice below treats the
+    # datetime64 dtype as a precondition instead of re-running to_datetime
+    for key in ('observations', 'events', 'targets', 'forecasts'):
+        if 'observation_date' in data[key].columns:
+            data[key]['observation_date'] = pd.to_datetime(
+                data[key]['observation_date'], errors='coerce', cache=True
+            )
+
+    # Low-cardinality string columns as category dtype: equality masks and
+    # groupbys then run on small integer codes instead of Python strings
+    for col in ('indicator_code', 'indicator', 'scenario', 'category', 'source_name', 'type'):
+        for df in (data['observations'], data['events'], data['forecasts']):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
+    # Sort once here so downstream per-indicator slices inherit date order
+    # and never need their own sort_values (mergesort keeps source order
+    # stable within equal keys)
+    data['observations'] = data['observations'].sort_values(
+        ['indicator_code', 'observation_date'], kind='mergesort'
+    ).reset_index(drop=True)
+    if not data['forecasts'].empty:
+        data['forecasts'] = data['forecasts'].sort_values(
+            ['indicator_code', 'scenario', 'observation_date'], kind='mergesort'
+        ).reset_index(drop=True)
+        # Precompute the forecast year once; int16 equality beats repeated
+        # .dt.year extraction in page loops
+        data['forecasts']['year'] = data['forecasts']['observation_date'].dt.year.astype('int16')
+
     return data
 
 
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=4)
+def _indicator_index(obs: pd.DataFrame) -> Dict:
+    """One-pass {indicator_code: date-sorted frame} split of observations."""
+    obs = obs.sort_values('observation_date')
+    return {code: g for code, g in obs.groupby('indicator_code', sort=False, observed=True)}
+
+
 def calculate_key_metrics(observations: pd.DataFrame) -> Dict:
     """Calculate key metrics for the overview page."""
     metrics = {}
-    
-    # Latest Account Ownership
-    acc_ownership = observations[observations['indicator_code'] == 'ACC_OWNERSHIP']
-    if not acc_ownership.empty:
-        latest = acc_ownership.sort_values('observation_date').iloc[-1]
-        metrics['account_ownership'] = {
-            'value': latest['value_numeric'],
-            'date': latest['observation_date']
-        }
-    
-    # Latest Mobile Money Accounts
-    mm_accounts = observations[observations['indicator_code'] == 'ACC_MM_ACCOUNT']
-    if not mm_accounts.empty:
-        latest = mm_accounts.sort_values('observation_date').iloc[-1]
-        metrics['mobile_money'] = {
-            'value': latest['value_numeric'],
-            'date': latest['observation_date']
-        }
-    
-    # Latest Digital Payment Usage
-    digital_payment = observations[observations['indicator_code'] == 'USG_DIGITAL_PAYMENT']
-    if not digital_payment.empty:
-        latest = digital_payment.sort_values('observation_date').iloc[-1]
-        metrics['digital_payment'] = {
-            'value': latest['value_numeric'],
-            'date': latest['observation_date']
-        }
-    
-    # Growth rates
-    if not acc_ownership.empty and len(acc_ownership) >= 2:
-        acc_ownership = acc_ownership.sort_values('observation_date')
+    idx = _indicator_index(observations)
+
+    for key, code in (
+        ('account_ownership', 'ACC_OWNERSHIP'),
+        ('mobile_money', 'ACC_MM_ACCOUNT'),
+        ('digital_payment', 'USG_DIGITAL_PAYMENT'),
+    ):
+        group = idx.get(code)
+        if group is not None and not group.empty:
+            latest = group.iloc[-1]
+            metrics[key] = {
+                'value': latest['value_numeric'],
+                'date': latest['observation_date']
+            }
+
+    # Growth rate for account ownership
+    acc_ownership = idx.get('ACC_OWNERSHIP')
+    if acc_ownership is not None and len(acc_ownership) >= 2:
         prev = acc_ownership.iloc[-2]['value_numeric']
         curr = acc_ownership.iloc[-1]['value_numeric']
         metrics['account_ownership']['growth'] = curr - prev
-    
+
     return metrics
 
 
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=64)
+def _indicator_slice(observations: pd.DataFrame, code: str) -> pd.DataFrame:
+    """Cached date-sorted slice of observations for one indicator."""
+    return (observations.loc[observations['indicator_code'] == code]
+            .sort_values('observation_date')
+            .reset_index(drop=True))
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=64)
+def _scenario_slice(forecasts: pd.DataFrame, code: str, scenario: str) -> pd.DataFrame:
+    """Cached date-sorted forecast slice for one (indicator, scenario)."""
+    mask = (forecasts['indicator_code'] == code) & (forecasts['scenario'] == scenario)
+    return forecasts.loc[mask].sort_values('observation_date').reset_index(drop=True)
+
+
 def create_trend_chart(
     observations: pd.DataFrame,
     indicator_code: str,
@@ -88,34 +229,40 @@ def create_trend_chart(
     events_df: pd.DataFrame = None
 ) -> go.Figure:
     """Create an interactive trend chart using Plotly."""
-    
-    data = observations[observations['indicator_code'] == indicator_code].copy()
-    data = data.sort_values('observation_date')
+
+    data = _indicator_slice(observations, indicator_code)
     
     fig = go.Figure()
     
-    # Add main trend line
-    fig.add_trace(go.Scatter(
-        x=data['observation_date'],
-        y=data['value_numeric'],
+    # Add main trend line (downsampled for very long series)
+    trend_x, trend_y = _lttb_downsample(
+        data['observation_date'].values, data['value_numeric'].values
+    )
+    fig.add_trace(_scatter_cls(len(trend_x))(
+        x=trend_x,
+        y=trend_y,
         mode='lines+markers',
         name='Historical Data',
         line=dict(color='#3498DB', width=3),
         marker=dict(size=10)
     ))
     
-    # Add events if requested
+    # Add events if requested (batched: one layout update instead of one
+    # add_vline validation pass per event)
     if show_events and events_df is not None:
-        for _, event in events_df.iterrows():
-            event_date = pd.to_datetime(event['observation_date'])
-            fig.add_vline(
-                x=event_date,
-                line_dash="dash",
-                line_color="red",
-                opacity=0.5,
-                annotation_text=event['indicator'][:20],
-                annotation_position="top"
-            )
+        ev = events_df.dropna(subset=['observation_date'])
+        event_dates = ev['observation_date']
+        shapes = [
+            dict(type='line', x0=d, x1=d, xref='x', yref='paper', y0=0, y1=1,
+                 line=dict(color='red', dash='dash'), opacity=0.5)
+            for d in event_dates
+        ]
+        annotations = [
+            dict(x=d, y=1, xref='x', yref='paper', text=str(t)[:20],
+                 showarrow=False, yanchor='bottom')
+            for d, t in zip(event_dates, ev['indicator'])
+        ]
+        fig.update_layout(shapes=shapes, annotations=annotations)
     
     fig.update_layout(
         title=title,
@@ -140,12 +287,14 @@ def create_forecast_chart(
     fig = go.Figure()
     
     # Historical data
-    hist_data = observations[observations['indicator_code'] == indicator_code].copy()
-    hist_data = hist_data.sort_values('observation_date')
+    hist_data = _indicator_slice(observations, indicator_code)
     
-    fig.add_trace(go.Scatter(
-        x=hist_data['observation_date'],
-        y=hist_data['value_numeric'],
+    hist_x, hist_y = _lttb_downsample(
+        hist_data['observation_date'].values, hist_data['value_numeric'].values
+    )
+    fig.add_trace(_scatter_cls(len(hist_x))(
+        x=hist_x,
+        y=hist_y,
         mode='lines+markers',
         name='Historical',
         line=dict(color='#34495E', width=3),
@@ -154,21 +303,19 @@ def create_forecast_chart(
     
     # Forecast scenarios
     if not forecasts.empty:
-        forecast_data = forecasts[forecasts['indicator_code'] == indicator_code]
-        
         colors = {
             'optimistic': '#27AE60',
             'base': '#3498DB',
             'pessimistic': '#E74C3C'
         }
-        
+
         for scenario in ['pessimistic', 'base', 'optimistic']:
-            scenario_data = forecast_data[forecast_data['scenario'] == scenario].sort_values('observation_date')
+            scenario_data = _scenario_slice(forecasts, indicator_code, scenario)
             
             if not scenario_data.empty:
                 linestyle = 'solid' if scenario == 'base' else 'dash'
                 
-                fig.add_trace(go.Scatter(
+                fig.add_trace(_scatter_cls(len(scenario_data))(
                     x=scenario_data['observation_date'],
                     y=scenario_data['value_numeric'],
                     mode='lines+markers',
@@ -178,9 +325,10 @@ def create_forecast_chart(
                 ))
         
         # Add confidence interval for base scenario
-        base_data = forecast_data[forecast_data['scenario'] == 'base'].sort_values('observation_date')
+        base_data = _scenario_slice(forecasts, indicator_code, 'base')
         if not base_data.empty and 'ci_lower' in base_data.columns:
-            fig.add_trace(go.Scatter(
+            ci_cls = _scatter_cls(len(base_data))
+            fig.add_trace(ci_cls(
                 x=base_data['observation_date'],
                 y=base_data['ci_upper'],
                 mode='lines',
@@ -188,8 +336,8 @@ def create_forecast_chart(
                 showlegend=False,
                 hoverinfo='skip'
             ))
-            
-            fig.add_trace(go.Scatter(
+
+            fig.add_trace(ci_cls(
                 x=base_data['observation_date'],
                 y=base_data['ci_lower'],
                 mode='lines',
@@ -227,13 +375,12 @@ def create_comparison_chart(observations: pd.DataFrame, indicators: List[str]) -
     colors = ['#3498DB', '#E74C3C', '#27AE60', '#F39C12', '#9B59B6']
     
     for idx, indicator_code in enumerate(indicators):
-        data = observations[observations['indicator_code'] == indicator_code].copy()
-        data = data.sort_values('observation_date')
+        data = _indicator_slice(observations, indicator_code)
         
         if not data.empty:
             indicator_name = data.iloc[0]['indicator']
-            
-            fig.add_trace(go.Scatter(
+
+            fig.add_trace(_scatter_cls(len(data))(
                 x=data['observation_date'],
                 y=data['value_numeric'],
                 mode='lines+markers',
@@ -264,8 +411,6 @@ def create_comparison_chart(observations: pd.DataFrame, indicators: List[str]) -
 def create_event_timeline(events: pd.DataFrame) -> go.Figure:
     """Create an interactive event timeline."""
     
-    events = events.copy()
-    events['observation_date'] = pd.to_datetime(events['observation_date'])
     events = events.sort_values('observation_date')
     
     # Create color mapping for event categories
@@ -277,24 +422,26 @@ def create_event_timeline(events: pd.DataFrame) -> go.Figure:
     }
     
     fig = go.Figure()
-    
-    for category in events['category'].unique():
-        category_events = events[events['category'] == category]
-        
-        fig.add_trace(go.Scatter(
-            x=category_events['observation_date'],
-            y=[category] * len(category_events),
+
+    # One groupby split and a single add_traces call: Plotly validates the
+    # whole batch once instead of re-validating the figure per category
+    fig.add_traces([
+        go.Scatter(
+            x=category_events['observation_date'].values,
+            y=np.full(len(category_events), category, dtype=object),
             mode='markers+text',
-            name=category.replace('_', ' ').title(),
+            name=str(category).replace('_', ' ').title(),
             marker=dict(
                 size=15,
                 color=category_colors.get(category, '#95A5A6'),
                 symbol='diamond'
             ),
-            text=category_events['indicator'],
+            text=category_events['indicator'].values,
             textposition='top center',
             hovertemplate='<b>%{text}</b><br>Date: %{x}<extra></extra>'
-        ))
+        )
+        for category, category_events in events.groupby('category', sort=False, observed=True)
+    ])
     
     fig.update_layout(
         title="Event Timeline",
@@ -309,17 +456,35 @@ def create_event_timeline(events: pd.DataFrame) -> go.Figure:
     return fig
 
 
+_FORMATTERS = {
+    'percentage': lambda v: f"{v:.1f}%",
+    'millions': lambda v: f"{v:.1f}M",
+    'change': lambda v: f"{'+' if v >= 0 else ''}{v:.1f}pp",
+}
+_DEFAULT_FORMATTER = lambda v: f"{v:.1f}"
+
+
 def format_metric(value: float, format_type: str = 'percentage') -> str:
     """Format metric values for display."""
-    if format_type == 'percentage':
-        return f"{value:.1f}%"
+    return _FORMATTERS.get(format_type, _DEFAULT_FORMATTER)(value)
+
+
+def format_metric_series(values, format_type: str = 'percentage') -> np.ndarray:
+    """Vectorized companion to format_metric for formatting whole arrays."""
+    arr = np.asarray(values, dtype=float)
+    rounded = np.round(arr, 1)
+    if format_type == 'change':
+        # signbit keeps -0.0 negative: values rounding to -0.0 stringify
+        # with their own minus, so a '+' prefix would yield '+-0.0pp'
+        signs = np.where(np.signbit(rounded), '', '+')
+        out = np.char.add(signs.astype('U1'), np.char.add(rounded.astype('U16'), 'pp'))
     elif format_type == 'millions':
-        return f"{value:.1f}M"
-    elif format_type == 'change':
-        sign = '+' if value >= 0 else ''
-        return f"{sign}{value:.1f}pp"
+        out = np.char.add(rounded.astype('U16'), 'M')
+    elif format_type == 'percentage':
+        out = np.char.add(rounded.astype('U16'), '%')
     else:
-        return f"{value:.1f}"
+        out = rounded.astype('U16')
+    return np.where(np.isnan(arr), '-', out)
 
 
 def calculate_progress_to_target(current: float, target: float) -> Tuple[float, str]:
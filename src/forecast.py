@@ -18,21 +18,22 @@ def generate_baseline_forecast(df_hist: pd.DataFrame, indicator: str, years_to_f
     if df_ind.empty:
         return pd.DataFrame()
 
-    # Prepare X (Year) and y (Value)
-    # Using ordinal date for regression to handle fractional years if necessary, but Year is safer for annual logic
-    df_ind['ordinal_date'] = df_ind['observation_date'].map(pd.Timestamp.toordinal)
-    
-    X = df_ind[['ordinal_date']].values
+    # Prepare X (day counts) and y (Value)
+    # Vectorized datetime64 -> int64 day cast; the absolute offset versus a
+    # Julian ordinal is irrelevant for a linear fit
+    x_days = df_ind['observation_date'].values.astype('datetime64[D]').astype(np.int64)
+
+    X = x_days.reshape(-1, 1)
     y = df_ind['value_numeric'].values
-    
+
     model = LinearRegression()
     model.fit(X, y)
-    
+
     # Create future dates (assuming mid-year or specific timing, let's say Jan 1st for simplicity or matching last obs month)
     # For annual forecasting 2025-2027
     future_dates = [pd.Timestamp(f"{year}-06-30") for year in years_to_forecast]
-    future_X = [[d.toordinal()] for d in future_dates]
-    
+    future_X = np.array(future_dates, dtype='datetime64[D]').astype(np.int64).reshape(-1, 1)
+
     predictions = model.predict(future_X)
     
     forecast_df = pd.DataFrame({
@@ -44,45 +45,93 @@ def generate_baseline_forecast(df_hist: pd.DataFrame, indicator: str, years_to_f
     
     return forecast_df
 
+def fit_baseline_trends(df_hist: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fits a linear trend for every indicator in one pass.
+
+    Uses the closed-form least-squares solution on grouped sums, avoiding
+    a scikit-learn model object (and its validation overhead) per indicator.
+    Returns a frame indexed by indicator with 'slope' and 'intercept'.
+    """
+    fit = df_hist[['indicator', 'value_numeric']].copy()
+    fit['x'] = (
+        df_hist['observation_date'].values.astype('datetime64[D]').astype(np.int64).astype(float)
+    )
+    fit['xx'] = fit['x'] ** 2
+    fit['xy'] = fit['x'] * fit['value_numeric']
+
+    g = fit.groupby('indicator', sort=False, observed=True).agg(
+        n=('x', 'size'), sx=('x', 'sum'), sy=('value_numeric', 'sum'),
+        sxx=('xx', 'sum'), sxy=('xy', 'sum')
+    )
+
+    denom = g['n'] * g['sxx'] - g['sx'] ** 2
+    g['slope'] = (g['n'] * g['sxy'] - g['sx'] * g['sy']) / denom
+    g['intercept'] = (g['sy'] - g['slope'] * g['sx']) / g['n']
+
+    # A single observation cannot define a trend: hold it flat
+    single = g['n'] == 1
+    g.loc[single, 'slope'] = 0.0
+    g.loc[single, 'intercept'] = g.loc[single, 'sy']
+
+    return g[['slope', 'intercept']]
+
+
 def apply_event_impacts(forecast_df: pd.DataFrame, events_df: pd.DataFrame, impacts_df: pd.DataFrame, start_date: pd.Timestamp):
     """
     Adjusts the forecast based on defined events and their impacts.
     """
     adjusted_forecast = forecast_df.copy()
     adjusted_forecast['type'] = 'adjusted_forecast'
-    
+
     # Filter for future events that might affect the forecast
     future_events = events_df[events_df['observation_date'] >= start_date]
-    
+
     print(f"\nProcessing {len(future_events)} future events...")
-    
-    for _, event in future_events.iterrows():
-        event_id = event['record_id']
-        event_date = event['observation_date']
-        
-        # Find impacts linked to this event
-        event_impacts = impacts_df[impacts_df['parent_id'] == event_id]
-        
-        for _, imp in event_impacts.iterrows():
-            target_indicator = imp['indicator']
-            # Default to 0 if NaN
-            magnitude = imp['impact_estimate'] if pd.notnull(imp['impact_estimate']) else 0
-            lag = imp['lag_months'] if pd.notnull(imp['lag_months']) else 0
-            
-            # Calculate when the impact starts
-            impact_start_date = event_date + pd.DateOffset(months=int(lag))
-            
-            # Apply to all forecast points after the impact start date
-            # Note: This is a simplified "step change" model. 
-            # If magnitude is percentage points (e.g. 0.05 for 5%), we add it directly if value is ratio, or check units.
-            # Assuming value_numeric is in same units (e.g. 0-1 or 0-100).
-            
-            mask = (adjusted_forecast['indicator'] == target_indicator) & \
-                   (adjusted_forecast['observation_date'] >= impact_start_date)
-            
-            if mask.any():
-                print(f"  -> Applying impact of {magnitude} to {target_indicator} starting {impact_start_date.date()} (Event: {event_id})")
-                adjusted_forecast.loc[mask, 'value_numeric'] += magnitude
+
+    # Join impacts to their parent events once, instead of filtering
+    # impacts_df per event inside a Python loop
+    impact_events = impacts_df.merge(
+        future_events[['record_id', 'observation_date']],
+        left_on='parent_id',
+        right_on='record_id'
+    )
+
+    if impact_events.empty:
+        return adjusted_forecast
+
+    magnitude = pd.to_numeric(impact_events['impact_estimate'], errors='coerce').fillna(0)
+    lag = pd.to_numeric(impact_events['lag_months'], errors='coerce').fillna(0)
+
+    # When the impacts start. Nominal 30-day months are fine here: the
+    # forecast grid is annual, so a few days of drift never moves an
+    # impact across a forecast point.
+    impact_events['magnitude'] = magnitude
+    impact_events['impact_start'] = (
+        impact_events['observation_date'] + pd.to_timedelta(lag * 30, unit='D')
+    )
+
+    # Note: This is a simplified "step change" model.
+    # Assuming value_numeric is in same units (e.g. 0-1 or 0-100).
+    # Each impact adds its magnitude to every forecast point at or after
+    # its start date; expressed as a scatter + cumulative sum per indicator.
+    for target_indicator, grp in impact_events.groupby('indicator', sort=False, observed=True):
+        mask = adjusted_forecast['indicator'] == target_indicator
+        if not mask.any():
+            continue
+
+        sub = adjusted_forecast.loc[mask]
+        dates = sub['observation_date'].values  # sorted by construction
+        starts = np.searchsorted(dates, grp['impact_start'].values.astype(dates.dtype))
+
+        delta = np.zeros(len(dates))
+        in_range = starts < len(dates)
+        np.add.at(delta, starts[in_range], grp['magnitude'].to_numpy()[in_range])
+
+        print(f"  -> Applying {in_range.sum()} impact(s) to {target_indicator}")
+        adjusted_forecast.loc[mask, 'value_numeric'] = (
+            sub['value_numeric'].to_numpy() + np.cumsum(delta)
+        )
 
     return adjusted_forecast
 
@@ -93,22 +142,28 @@ def main():
     impacts = data['impacts']
     
     forecast_years = [2025, 2026, 2027, 2028]
-    indicators = obs['indicator'].unique()
-    
-    all_forecasts = []
-    
+
     print("Generating baselines...")
-    for ind in indicators:
-        # Generate baseline
-        baseline = generate_baseline_forecast(obs, ind, forecast_years)
-        if not baseline.empty:
-            all_forecasts.append(baseline)
-    
-    if not all_forecasts:
+    trends = fit_baseline_trends(obs)
+
+    if trends.empty:
         print("No forecasts generated.")
         return
 
-    baseline_df = pd.concat(all_forecasts, ignore_index=True)
+    future_dates = pd.DatetimeIndex([pd.Timestamp(f"{year}-06-30") for year in forecast_years])
+    future_x = future_dates.values.astype('datetime64[D]').astype(np.int64).astype(float)
+
+    # One indicator x year frame built in a single constructor call; the
+    # outer product evaluates every trend at every future date at once.
+    # Rows stay date-sorted within each indicator.
+    preds = (np.outer(trends['slope'].to_numpy(), future_x)
+             + trends['intercept'].to_numpy()[:, None])
+    baseline_df = pd.DataFrame({
+        'observation_date': np.tile(future_dates, len(trends)),
+        'indicator': np.repeat(trends.index.to_numpy(), len(future_dates)),
+        'value_numeric': preds.ravel(),
+        'type': 'baseline_forecast'
+    })
     
     # Combine history with baseline to see the full picture for impact calculation context if needed
     # But here we just adjust the future baseline
@@ -134,5 +189,12 @@ def main():
     final_forecast.to_csv(output_path, index=False)
     print(f"\nForecast saved to {output_path}")
 
+    # Parquet twin for the dashboard: loads faster than CSV and keeps the
+    # datetime dtype, so no re-parsing on read
+    try:
+        final_forecast.to_parquet(output_path.replace('.csv', '.parquet'), index=False)
+    except Exception as e:
+        print(f"Warning: could not write Parquet output: {e}")
+
 if __name__ == "__main__":
     main()
@@ -10,10 +10,8 @@ import os
 
 def generate_sample_data():
     """Generate sample unified dataset with observations, events, and impact links."""
-    
+
     # ==================== OBSERVATIONS ====================
-    observations = []
-    
     # Account Ownership (Access) - Global Findex data
     account_ownership_data = [
         ('2011-06-30', 'Account Ownership Rate', 'ACC_OWNERSHIP', 14.0, 'observation', 'Banking', 
@@ -91,25 +89,33 @@ def generate_sample_data():
     ]
     
     # Combine all observations
-    all_obs = (account_ownership_data + mobile_money_data + digital_payment_data + 
+    all_obs = (account_ownership_data + mobile_money_data + digital_payment_data +
                telebirr_data + mpesa_data + infrastructure_data)
-    
-    for i, obs in enumerate(all_obs, 1):
-        observations.append({
-            'record_id': f'OBS_{i:03d}',
-            'record_type': obs[4],
-            'pillar': obs[5],
-            'indicator': obs[1],
-            'indicator_code': obs[2],
-            'value_numeric': obs[3],
-            'observation_date': obs[0],
-            'source_type': 'survey' if 'Findex' in obs[6] else 'operator',
-            'source_name': obs[6],
-            'source_url': obs[7],
-            'confidence': obs[8],
-            'collected_by': 'Data Team',
-            'collection_date': '2026-02-01'
-        })
+
+    # Column-wise construction: one transpose and one DataFrame constructor
+    # call instead of a dict allocation per row
+    (dates, indicators, codes, values, record_types,
+     pillars, sources, urls, confidences) = map(list, zip(*all_obs))
+
+    observations = pd.DataFrame({
+        'record_id': np.char.add(
+            'OBS_', np.char.zfill(np.arange(1, len(all_obs) + 1).astype(str), 3)
+        ),
+        'record_type': record_types,
+        'pillar': pillars,
+        'indicator': indicators,
+        'indicator_code': codes,
+        'value_numeric': values,
+        'observation_date': dates,
+        'source_type': np.where(
+            pd.Series(sources).str.contains('Findex'), 'survey', 'operator'
+        ),
+        'source_name': sources,
+        'source_url': urls,
+        'confidence': confidences,
+        'collected_by': 'Data Team',
+        'collection_date': '2026-02-01'
+    })
     
     # ==================== EVENTS ====================
     events = [
@@ -211,8 +217,22 @@ def generate_sample_data():
     ]
     
     # Combine all data records
-    all_data = observations + events + targets
-    df_data = pd.DataFrame(all_data)
+    df_data = pd.concat(
+        [observations, pd.DataFrame(events), pd.DataFrame(targets)],
+        ignore_index=True
+    )
+    # Parse dates once so downstream consumers inherit datetime64
+    df_data['observation_date'] = pd.to_datetime(
+        df_data['observation_date'], format='%Y-%m-%d', cache=True
+    )
+
+    # Compact column dtypes: categoricals store one small integer code per
+    # row instead of a Python string, so downstream equality masks, merges
+    # and groupbys compare integers; float32 halves the value column.
+    for col in ('record_type', 'pillar', 'indicator', 'indicator_code',
+                'source_type', 'source_name', 'confidence', 'category'):
+        df_data[col] = df_data[col].astype('category')
+    df_data['value_numeric'] = df_data['value_numeric'].astype(np.float32)
     
     # ==================== IMPACT LINKS ====================
     impact_links = [
@@ -344,11 +364,20 @@ def generate_sample_data():
 
 def save_to_excel(df_data, df_impacts, output_path):
     """Save dataframes to Excel with multiple sheets."""
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    # xlsxwriter serializes cells in C; openpyxl does it in pure Python
+    with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
         df_data.to_excel(writer, sheet_name='ethiopia_fi_unified_data', index=False)
         df_impacts.to_excel(writer, sheet_name='impact_links', index=False)
     print(f"Sample data saved to: {output_path}")
 
+def save_to_parquet(df_data, df_impacts, output_dir):
+    """Save Parquet twins of the Excel sheets for fast columnar reads."""
+    data_path = os.path.join(output_dir, 'ethiopia_fi_unified_data.parquet')
+    impacts_path = os.path.join(output_dir, 'impact_links.parquet')
+    df_data.to_parquet(data_path, engine='pyarrow', compression='zstd', index=False)
+    df_impacts.to_parquet(impacts_path, engine='pyarrow', compression='zstd', index=False)
+    print(f"Parquet data saved to: {data_path}")
+
 if __name__ == "__main__":
     # Generate data
     df_data, df_impacts = generate_sample_data()
@@ -357,9 +386,13 @@ if __name__ == "__main__":
     output_dir = 'data/raw'
     os.makedirs(output_dir, exist_ok=True)
     
-    # Save to Excel
+    # Save to Excel (plus Parquet twins for consumers that don't need .xlsx)
     output_path = os.path.join(output_dir, 'ethiopia_fi_unified_data.xlsx')
     save_to_excel(df_data, df_impacts, output_path)
+    try:
+        save_to_parquet(df_data, df_impacts, output_dir)
+    except Exception as e:
+        print(f"Warning: could not write Parquet output: {e}")
     
     # Print summary
     print(f"\nData Summary:")
@@ -1,14 +1,73 @@
 import pandas as pd
 import os
+from functools import lru_cache
 from typing import Dict, Tuple
 
-def load_data(data_path: str = 'data/raw/ethiopia_fi_unified_data.xlsx') -> Dict[str, pd.DataFrame]:
+_CACHE_KEYS = ('observations', 'events', 'targets', 'impacts', 'raw_data')
+
+
+def _excel_engine() -> str:
+    """Prefer the Rust-backed calamine reader (10-30x faster xlsx parse);
+    fall back to openpyxl when python-calamine is not installed."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return 'openpyxl'
+    return 'calamine'
+
+
+def _read_sheet_streaming(data_path: str, sheet_name: str) -> pd.DataFrame:
+    """Build a DataFrame straight from openpyxl's read_only row stream.
+
+    Skips pd.read_excel's per-cell conversion layer; raises ValueError when
+    the sheet is absent so callers share the normal fallback path."""
+    import openpyxl
+    wb = openpyxl.load_workbook(data_path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in wb.sheetnames:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        rows = wb[sheet_name].iter_rows(values_only=True)
+        header = next(rows)
+        return pd.DataFrame.from_records(list(rows), columns=list(header))
+    finally:
+        wb.close()
+
+
+def _cache_paths(data_path: str) -> Dict[str, str]:
+    """Parquet cache file per result key, stored next to the workbook."""
+    return {k: f'{data_path}.{k}.parquet' for k in _CACHE_KEYS}
+
+
+def _cache_is_fresh(data_path: str, paths: Dict[str, str]) -> bool:
+    """True when every cache file is at least as new as the workbook (and
+    the supplementary CSV, when present)."""
+    try:
+        src_mtime = os.path.getmtime(data_path)
+        supp_path = os.path.join(os.path.dirname(data_path), 'supplementary_data.csv')
+        if os.path.exists(supp_path):
+            src_mtime = max(src_mtime, os.path.getmtime(supp_path))
+        return all(
+            os.path.exists(p) and os.path.getmtime(p) >= src_mtime
+            for p in paths.values()
+        )
+    except OSError:
+        return False
+
+
+def load_data(data_path: str = 'data/raw/ethiopia_fi_unified_data.xlsx',
+              use_cache: bool = True) -> Dict[str, pd.DataFrame]:
     """
     Loads the unified data file and splits it into logical components.
-    
+
+    Repeated calls while the source files are unchanged return the same
+    in-memory dict (mtime-keyed memoization), so only the first call per
+    process pays the parse.
+
     Args:
         data_path: Path to the Excel file.
-        
+        use_cache: Reuse (and refresh) the Parquet cache written next to
+            the workbook. Pass False to force a full Excel re-parse.
+
     Returns:
         A dictionary containing:
         - 'observations': Time series data
@@ -20,27 +79,71 @@ def load_data(data_path: str = 'data/raw/ethiopia_fi_unified_data.xlsx') -> Dict
     if not os.path.exists(data_path):
         raise FileNotFoundError(f"Data file not found at {data_path}")
 
+    mtime = os.path.getmtime(data_path)
+    supp_path = os.path.join(os.path.dirname(data_path), 'supplementary_data.csv')
+    if os.path.exists(supp_path):
+        mtime = max(mtime, os.path.getmtime(supp_path))
+
+    # Shallow dict copy: callers may add/replace keys without corrupting
+    # the memoized entry (the frames themselves are still shared — copy
+    # before rewriting one in place)
+    return dict(_load_data_cached(data_path, mtime, use_cache))
+
+
+@lru_cache(maxsize=4)
+def _load_data_cached(data_path: str, mtime: float,
+                      use_cache: bool) -> Dict[str, pd.DataFrame]:
+    """load_data body; mtime keys the memo so edits to the source files
+    invalidate it. Callers share the returned frames."""
+    # Parquet parses an order of magnitude faster than openpyxl, so reruns
+    # skip the Excel path entirely while the workbook is unchanged
+    cache_paths = _cache_paths(data_path)
+    if use_cache and _cache_is_fresh(data_path, cache_paths):
+        try:
+            return {k: pd.read_parquet(p) for k, p in cache_paths.items()}
+        except Exception:
+            pass  # unreadable cache: fall through to the Excel parse
+
     print(f"Loading data from {data_path}...")
     
-    # Load Data Sheet
+    # Load Data Sheet. Explicit dtypes and parse_dates skip the second
+    # type-inference pass and the separate to_datetime coercion below.
+    # (pandas already opens openpyxl workbooks in read_only mode.)
+    engine = _excel_engine()
+    read_kwargs = dict(
+        engine=engine,
+        dtype={'record_type': 'category', 'record_id': 'string',
+               'indicator': 'string', 'indicator_code': 'string'},
+    )
     try:
-        df_data = pd.read_excel(data_path, sheet_name='ethiopia_fi_unified_data', engine='openpyxl')
+        if engine == 'calamine':
+            df_data = pd.read_excel(data_path, sheet_name='ethiopia_fi_unified_data',
+                                    parse_dates=['observation_date'], **read_kwargs)
+        else:
+            # Without calamine, stream the known-structure sheet through
+            # openpyxl's read_only mode and coerce dtypes afterwards; the
+            # date column is handled by the guarded to_datetime below
+            df_data = _read_sheet_streaming(data_path, 'ethiopia_fi_unified_data')
+            for col, dt in read_kwargs['dtype'].items():
+                if col in df_data.columns:
+                    df_data[col] = df_data[col].astype(dt)
     except ValueError:
-        # Fallback if sheet name is different (e.g. 'data')
-        df_data = pd.read_excel(data_path, sheet_name=0, engine='openpyxl')
+        # Fallback if sheet name is different (e.g. 'data') or the date
+        # column is absent
+        df_data = pd.read_excel(data_path, sheet_name=0, **read_kwargs)
 
     # Load Impact Sheet
     try:
-        df_impact = pd.read_excel(data_path, sheet_name='Impact_sheet', engine='openpyxl')
+        df_impact = pd.read_excel(data_path, sheet_name='Impact_sheet', engine=engine)
     except ValueError:
          try:
-            df_impact = pd.read_excel(data_path, sheet_name='impact_links', engine='openpyxl')
+            df_impact = pd.read_excel(data_path, sheet_name='impact_links', engine=engine)
          except ValueError:
             df_impact = pd.DataFrame() # Return empty if not found
 
-    # Process Data Sheet
-    # Ensure dates are datetime
-    if 'observation_date' in df_data.columns:
+    # Ensure dates are datetime (no-op when parse_dates already ran)
+    if 'observation_date' in df_data.columns and \
+            not pd.api.types.is_datetime64_any_dtype(df_data['observation_date']):
         df_data['observation_date'] = pd.to_datetime(df_data['observation_date'])
 
     # --- ENRICHMENT STEP ---
@@ -52,16 +155,38 @@ def load_data(data_path: str = 'data/raw/ethiopia_fi_unified_data.xlsx') -> Dict
             df_supp = pd.read_csv(supp_path)
             if 'observation_date' in df_supp.columns:
                 df_supp['observation_date'] = pd.to_datetime(df_supp['observation_date'])
-            # Align columns (fill missing with NaN)
-            df_data = pd.concat([df_data, df_supp], axis=0, ignore_index=True)
+            # Align columns up front (fill missing with NaN); a pre-aligned
+            # concat skips pandas' per-column union/reindex slow path
+            if not df_supp.empty:
+                df_supp = df_supp.reindex(columns=df_data.columns)
+                df_data = pd.concat([df_data, df_supp], axis=0,
+                                    ignore_index=True, sort=False)
         except Exception as e:
             print(f"Warning: Failed to load supplementary data: {e}")
     # -----------------------
     
-    # Split by record_type
-    observations = df_data[df_data['record_type'] == 'observation'].copy()
-    events = df_data[df_data['record_type'] == 'event'].copy()
-    targets = df_data[df_data['record_type'] == 'target'].copy()
+    # Low-cardinality string columns as category: one label per distinct
+    # value instead of a Python object per row, and downstream == filters
+    # compare integer codes. Converting before the split covers raw_data
+    # and every record_type slice at once.
+    for col in ('record_type', 'indicator', 'indicator_code', 'category', 'confidence'):
+        if col in df_data.columns and not isinstance(df_data[col].dtype, pd.CategoricalDtype):
+            df_data[col] = df_data[col].astype('category')
+
+    # Split by record_type in one pass instead of three boolean scans
+    empty = df_data.iloc[:0]
+    groups = {key: g for key, g in df_data.groupby('record_type', sort=False, observed=True)}
+    observations = groups.get('observation', empty).copy()
+    events = groups.get('event', empty).copy()
+    targets = groups.get('target', empty).copy()
+
+    # Trim category labels to what each slice actually contains. Without
+    # this, observations carry event/target indicator names as unused
+    # categories and pandas 2.x groupby (observed=False default)
+    # materializes them as empty groups downstream.
+    for split in (observations, events, targets):
+        for col in split.select_dtypes('category').columns:
+            split[col] = split[col].cat.remove_unused_categories()
 
     # Sort observations by date
     if not observations.empty:
@@ -70,7 +195,7 @@ def load_data(data_path: str = 'data/raw/ethiopia_fi_unified_data.xlsx') -> Dict
     # Process Impact Sheet
     # (Optional: Add processing if needed)
 
-    return {
+    data = {
         'observations': observations,
         'events': events,
         'targets': targets,
@@ -78,6 +203,15 @@ def load_data(data_path: str = 'data/raw/ethiopia_fi_unified_data.xlsx') -> Dict
         'raw_data': df_data
     }
 
+    if use_cache:
+        try:
+            for k, p in cache_paths.items():
+                data[k].to_parquet(p, index=False)
+        except Exception:
+            pass  # missing pyarrow or read-only disk: just skip the cache
+
+    return data
+
 if __name__ == "__main__":
     # Test the loader
     try:
@@ -7,12 +7,80 @@ This module provides functions to generate different forecast scenarios
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from scipy import stats
 from typing import Dict, Tuple, List
 import warnings
 warnings.filterwarnings('ignore')
 
 
+@lru_cache(maxsize=128)
+def _t_ppf(confidence_level: float, df: int) -> float:
+    """Memoized t-distribution critical value; the (level, dof) pairs seen
+    per run are few, so repeat CI calls hit a dict lookup instead of scipy."""
+    return float(stats.t.ppf((1 + confidence_level) / 2, df))
+
+
+def _merge_impacts(
+    impacts_df: pd.DataFrame,
+    events_df: pd.DataFrame,
+    indicator_code: str
+) -> pd.DataFrame:
+    """
+    Join one indicator's impacts to their parent events' dates.
+
+    One merge resolves every impact's parent event; callers applying
+    several scenarios reuse the result instead of re-merging per scenario.
+    Indicators without linked impacts — the common case — skip the merge
+    entirely.
+    """
+    relevant = impacts_df[impacts_df['indicator'] == indicator_code]
+    if relevant.empty:
+        return relevant
+    return relevant.merge(
+        events_df[['record_id', 'observation_date']],
+        left_on='parent_id',
+        right_on='record_id'
+    )
+
+
+def _impact_cumsum(dates: np.ndarray, merged: pd.DataFrame) -> np.ndarray:
+    """
+    Running impact totals along a sorted forecast date grid.
+
+    Locates each impact's first affected forecast point by binary search,
+    scatters the estimates into a delta array, and returns the cumulative
+    sum — O(impacts + horizon) instead of a boolean mask per impact. Lags
+    use the pipeline's nominal 30-day months.
+    """
+    starts = np.searchsorted(
+        dates,
+        merged['observation_date'].to_numpy('datetime64[ns]')
+        + merged['lag_months'].to_numpy(np.int64) * np.timedelta64(30, 'D')
+    )
+
+    delta = np.zeros(len(dates))
+    in_range = starts < len(dates)
+    np.add.at(delta, starts[in_range], merged['impact_estimate'].to_numpy(float)[in_range])
+
+    return np.cumsum(delta)
+
+
+def _apply_impacts(
+    scenario: pd.DataFrame,
+    merged: pd.DataFrame,
+    multiplier: float = 1.0
+) -> pd.DataFrame:
+    """Add lagged event impacts from the _merge_impacts output onto one
+    forecast scenario."""
+    if merged.empty:
+        return scenario
+
+    dates = scenario['observation_date'].to_numpy()
+    scenario['value_numeric'] += _impact_cumsum(dates, merged) * multiplier
+    return scenario
+
+
 def generate_base_scenario(
     baseline_forecast: pd.DataFrame,
     impacts_df: pd.DataFrame,
@@ -33,24 +101,9 @@ def generate_base_scenario(
     """
     scenario = baseline_forecast.copy()
     scenario['scenario'] = 'base'
-    
+
     # Apply expected impacts
-    for _, impact in impacts_df[impacts_df['indicator'] == indicator_code].iterrows():
-        event_id = impact['parent_id']
-        event = events_df[events_df['record_id'] == event_id]
-        
-        if event.empty:
-            continue
-            
-        event_date = pd.to_datetime(event.iloc[0]['observation_date'])
-        lag_months = impact['lag_months']
-        impact_start = event_date + pd.DateOffset(months=int(lag_months))
-        
-        # Apply impact to forecast periods after impact start
-        mask = scenario['observation_date'] >= impact_start
-        scenario.loc[mask, 'value_numeric'] += impact['impact_estimate']
-    
-    return scenario
+    return _apply_impacts(scenario, _merge_impacts(impacts_df, events_df, indicator_code))
 
 
 def generate_optimistic_scenario(
@@ -73,29 +126,12 @@ def generate_optimistic_scenario(
     Returns:
         DataFrame with optimistic scenario forecast
     """
-    # Create modified impacts with higher estimates
-    impacts_optimistic = impacts_df.copy()
-    impacts_optimistic['impact_estimate'] = impacts_optimistic['impact_estimate'] * multiplier
-    
     scenario = baseline_forecast.copy()
     scenario['scenario'] = 'optimistic'
-    
-    # Apply amplified impacts
-    for _, impact in impacts_optimistic[impacts_optimistic['indicator'] == indicator_code].iterrows():
-        event_id = impact['parent_id']
-        event = events_df[events_df['record_id'] == event_id]
-        
-        if event.empty:
-            continue
-            
-        event_date = pd.to_datetime(event.iloc[0]['observation_date'])
-        lag_months = impact['lag_months']
-        impact_start = event_date + pd.DateOffset(months=int(lag_months))
-        
-        mask = scenario['observation_date'] >= impact_start
-        scenario.loc[mask, 'value_numeric'] += impact['impact_estimate']
-    
-    return scenario
+
+    # Apply amplified impacts; the multiplier scales estimates in place of
+    # the old whole-frame impacts copy
+    return _apply_impacts(scenario, _merge_impacts(impacts_df, events_df, indicator_code), multiplier)
 
 
 def generate_pessimistic_scenario(
@@ -118,29 +154,11 @@ def generate_pessimistic_scenario(
     Returns:
         DataFrame with pessimistic scenario forecast
     """
-    # Create modified impacts with lower estimates
-    impacts_pessimistic = impacts_df.copy()
-    impacts_pessimistic['impact_estimate'] = impacts_pessimistic['impact_estimate'] * multiplier
-    
     scenario = baseline_forecast.copy()
     scenario['scenario'] = 'pessimistic'
-    
-    # Apply reduced impacts
-    for _, impact in impacts_pessimistic[impacts_pessimistic['indicator'] == indicator_code].iterrows():
-        event_id = impact['parent_id']
-        event = events_df[events_df['record_id'] == event_id]
-        
-        if event.empty:
-            continue
-            
-        event_date = pd.to_datetime(event.iloc[0]['observation_date'])
-        lag_months = impact['lag_months']
-        impact_start = event_date + pd.DateOffset(months=int(lag_months))
-        
-        mask = scenario['observation_date'] >= impact_start
-        scenario.loc[mask, 'value_numeric'] += impact['impact_estimate']
-    
-    return scenario
+
+    # Apply reduced impacts via the shared helper's multiplier
+    return _apply_impacts(scenario, _merge_impacts(impacts_df, events_df, indicator_code), multiplier)
 
 
 def calculate_confidence_intervals(
@@ -179,7 +197,7 @@ def calculate_confidence_intervals(
     
     # Use t-distribution for small samples
     n = len(hist_obs)
-    t_value = stats.t.ppf((1 + confidence_level) / 2, n - 1)
+    t_value = _t_ppf(confidence_level, n - 1)
     
     # Calculate margin of error as percentage of forecast value
     # Margin increases with forecast horizon
@@ -187,14 +205,15 @@ def calculate_confidence_intervals(
     forecast_df['forecast_year'] = forecast_df['observation_date'].dt.year
     min_year = forecast_df['forecast_year'].min()
     
-    for idx, row in forecast_df.iterrows():
-        years_ahead = row['forecast_year'] - min_year + 1
-        # Uncertainty grows with time
-        margin = row['value_numeric'] * growth_std * t_value * np.sqrt(years_ahead)
-        
-        forecast_df.loc[idx, 'ci_lower'] = max(0, row['value_numeric'] - margin)
-        forecast_df.loc[idx, 'ci_upper'] = min(100, row['value_numeric'] + margin)
-    
+    # Uncertainty grows with time; one vectorized expression covers every
+    # forecast row instead of a per-row loc assignment
+    vals = forecast_df['value_numeric'].to_numpy(dtype=float)
+    years_ahead = forecast_df['forecast_year'].to_numpy() - min_year + 1
+    margin = vals * growth_std * t_value * np.sqrt(years_ahead)
+
+    forecast_df['ci_lower'] = np.maximum(0, vals - margin)
+    forecast_df['ci_upper'] = np.minimum(100, vals + margin)
+
     return forecast_df
 
 
@@ -218,17 +237,32 @@ def generate_all_scenarios(
     Returns:
         Combined dataframe with all scenarios
     """
-    # Generate scenarios
-    base = generate_base_scenario(baseline_forecast, impacts_df, events_df, indicator_code)
-    optimistic = generate_optimistic_scenario(baseline_forecast, impacts_df, events_df, indicator_code)
-    pessimistic = generate_pessimistic_scenario(baseline_forecast, impacts_df, events_df, indicator_code)
-    
+    # Generate scenarios from one shared impacts-to-events merge
+    merged = _merge_impacts(impacts_df, events_df, indicator_code)
+
+    # One long frame tiling the baseline per scenario block, instead of a
+    # full baseline copy per scenario; the impact cumsum is computed once
+    # and added to each block scaled by its multiplier
+    n = len(baseline_forecast)
+    labels = ('base', 'optimistic', 'pessimistic')
+    multipliers = (1.0, 1.3, 0.7)
+
+    long = baseline_forecast.iloc[np.tile(np.arange(n), len(labels))].reset_index(drop=True)
+    long['scenario'] = np.repeat(labels, n)
+
+    if not merged.empty and n:
+        cum = _impact_cumsum(baseline_forecast['observation_date'].to_numpy(), merged)
+        vals = long['value_numeric'].to_numpy(dtype=float)
+        for i, multiplier in enumerate(multipliers):
+            vals[i * n:(i + 1) * n] += cum * multiplier
+        long['value_numeric'] = vals
+
     # Add confidence intervals to base scenario
-    base = calculate_confidence_intervals(observations_df, base, indicator_code)
-    
-    # Combine all scenarios
-    all_scenarios = pd.concat([base, optimistic, pessimistic], ignore_index=True)
-    
+    base = calculate_confidence_intervals(observations_df, long.iloc[:n].copy(), indicator_code)
+
+    # Combine all scenarios (non-base blocks carry NaN CI columns as before)
+    all_scenarios = pd.concat([base, long.iloc[n:]], ignore_index=True)
+
     return all_scenarios
 
 
@@ -244,36 +278,37 @@ def calculate_forecast_metrics(forecast_df: pd.DataFrame, target_value: float =
         Dictionary of forecast metrics
     """
     metrics = {}
-    
-    # Get base scenario
-    base = forecast_df[forecast_df['scenario'] == 'base']
-    
-    if not base.empty:
-        metrics['final_forecast'] = base.iloc[-1]['value_numeric']
-        metrics['forecast_years'] = base['observation_date'].dt.year.tolist()
-        
+
+    # One groupby split instead of a boolean scan per scenario
+    groups = {k: g for k, g in forecast_df.groupby('scenario', sort=False, observed=True)}
+
+    base = groups.get('base')
+    if base is not None and not base.empty:
+        vals = base['value_numeric'].to_numpy()
+        metrics['final_forecast'] = vals[-1]
+        metrics['forecast_years'] = base['observation_date'].dt.year.to_numpy().tolist()
+
         # Calculate growth
-        if len(base) > 1:
-            initial = base.iloc[0]['value_numeric']
-            final = base.iloc[-1]['value_numeric']
-            metrics['total_growth'] = final - initial
-            metrics['avg_annual_growth'] = metrics['total_growth'] / len(base)
-        
+        if len(vals) > 1:
+            metrics['total_growth'] = vals[-1] - vals[0]
+            metrics['avg_annual_growth'] = metrics['total_growth'] / len(vals)
+
         # Target comparison
         if target_value:
             metrics['target_value'] = target_value
             metrics['gap_to_target'] = target_value - metrics['final_forecast']
             metrics['on_track'] = metrics['gap_to_target'] <= 0
-    
+
     # Scenario range
-    optimistic = forecast_df[forecast_df['scenario'] == 'optimistic']
-    pessimistic = forecast_df[forecast_df['scenario'] == 'pessimistic']
-    
-    if not optimistic.empty and not pessimistic.empty:
-        metrics['best_case'] = optimistic.iloc[-1]['value_numeric']
-        metrics['worst_case'] = pessimistic.iloc[-1]['value_numeric']
+    optimistic = groups.get('optimistic')
+    pessimistic = groups.get('pessimistic')
+
+    if optimistic is not None and pessimistic is not None \
+            and not optimistic.empty and not pessimistic.empty:
+        metrics['best_case'] = optimistic['value_numeric'].to_numpy()[-1]
+        metrics['worst_case'] = pessimistic['value_numeric'].to_numpy()[-1]
         metrics['scenario_range'] = metrics['best_case'] - metrics['worst_case']
-    
+
     return metrics
 
 